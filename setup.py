@@ -14,7 +14,6 @@ setup(
         "requests>=2.25.1",
         "tqdm>=4.60.0",
         "numpy>=1.19.5",
-        "pandas>=1.2.4",
         "scikit-learn>=0.24.2",
         "torch>=1.8.0",
         "python-dotenv>=0.19.0",
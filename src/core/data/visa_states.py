@@ -1,12 +1,21 @@
 """Constants for visa types and US states."""
 
-US_VISAS = {
+import re
+
+def _with_hyphen_variants(visas: dict) -> dict:
+    """Add the hyphenated spelling ("h-1b") after each letter-digit visa code ("h1b")"""
+    variants = {}
+    for key, name in visas.items():
+        variants[key] = name
+        if re.match(r'[a-z]\d', key):
+            variants[f"{key[0]}-{key[1:]}"] = name
+    return variants
+
+# Canonical visa keys; hyphenated codes are derived by _with_hyphen_variants
+_VISA_CANONICAL = {
     "h1b": "H-1B Specialty Occupations",
-    "h-1b": "H-1B Specialty Occupations",
     "l1": "L-1 Intracompany Transfer",
-    "l-1": "L-1 Intracompany Transfer",
     "f1": "F-1 Student Visa",
-    "f-1": "F-1 Student Visa",
     "opt": "Optional Practical Training",
     "cpt": "Curricular Practical Training",
     "gc": "Green Card",
@@ -17,22 +26,17 @@ US_VISAS = {
     "ead": "Employment Authorization Document",
     "tn": "TN NAFTA Professionals",
     "h4": "H-4 Dependent",
-    "h-4": "H-4 Dependent",
     "j1": "J-1 Exchange Visitor",
-    "j-1": "J-1 Exchange Visitor",
     "b1": "B-1 Business Visitor",
-    "b-1": "B-1 Business Visitor",
     "b2": "B-2 Tourist Visitor",
-    "b-2": "B-2 Tourist Visitor",
     "o1": "O-1 Extraordinary Ability",
-    "o-1": "O-1 Extraordinary Ability",
     "e3": "E-3 Specialty Occupation (Australia)",
-    "e-3": "E-3 Specialty Occupation (Australia)",
     "permanent resident": "Green Card",
     "lawful permanent resident": "Green Card",
     "asylee": "Asylee",
     "refugee": "Refugee"
 }
+US_VISAS = _with_hyphen_variants(_VISA_CANONICAL)
 
 US_STATES = {
     "alabama": "AL", "alaska": "AK", "arizona": "AZ", "arkansas": "AR",
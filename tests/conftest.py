@@ -1,5 +1,6 @@
 import pytest
 import os
+import spacy
 from pathlib import Path
 from src.core.data_models import ResumeData
 from src.core.resume_parser import ResumeParser
@@ -46,6 +47,13 @@ def resume_parser():
     """Fixture to provide ResumeParser instance"""
     return ResumeParser()
 
+@pytest.fixture(scope="session")
+def parser():
+    """Fixture to provide one shared ResumeParser with a blank NLP pipeline"""
+    parser = ResumeParser()
+    parser.nlp = parser.job_nlp = spacy.blank("en")
+    return parser
+
 @pytest.fixture
 def document_reader():
     """Fixture to provide DocumentReader instance"""
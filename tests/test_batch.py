@@ -0,0 +1,57 @@
+import threading
+import pytest
+from docx import Document
+from src.core.resume_parser import parse_many_files
+
+class StubReader:
+    """Document reader returning canned text per path"""
+
+    def __init__(self, texts):
+        self.texts = texts
+        self.threads = []
+
+    def read_document(self, file_path):
+        self.threads.append(threading.current_thread())
+        if file_path not in self.texts:
+            raise IOError(f"No such file: {file_path}")
+        return self.texts[file_path], False
+
+def test_parse_many_files_in_process(parser, monkeypatch):
+    """Test that workers=1 yields results in input order with None for unreadable files"""
+    monkeypatch.setattr(parser, "doc_reader", StubReader({
+        "a.pdf": "Jane Smith\njane@example.com",
+        "b.pdf": "John Doe\njohn@example.com",
+        "empty.pdf": "",
+        "c.pdf": "Ann Lee\nann@example.com"
+    }))
+    paths = ["c.pdf", "missing.pdf", "a.pdf", "empty.pdf", "b.pdf"]
+    results = list(parse_many_files(paths, workers=1, parser=parser))
+    assert [result is None for result in results] == [False, True, False, True, False]
+    assert [result["resume_link"].value for result in results if result] == ["c.pdf", "a.pdf", "b.pdf"]
+    assert results[0]["primary_email"].value == "ann@example.com"
+
+def test_parse_many_files_reads_ahead(parser, monkeypatch):
+    """Test that workers=1 reads files on a background thread, not the caller's"""
+    reader = StubReader({"a.pdf": "Jane Smith", "b.pdf": "John Doe"})
+    monkeypatch.setattr(parser, "doc_reader", reader)
+    results = list(parse_many_files(["a.pdf", "b.pdf"], workers=1, parser=parser))
+    assert len(results) == 2
+    assert len(reader.threads) == 2
+    assert threading.current_thread() not in reader.threads
+
+def test_parse_many_files_empty_input(parser):
+    """Test that an empty batch yields nothing"""
+    assert list(parse_many_files([], workers=1, parser=parser)) == []
+
+def test_parse_many_files_process_pool(tmp_path):
+    """Test that the process pool yields one result per file, in input order"""
+    paths = []
+    for name in ["first", "second"]:
+        document = Document()
+        document.add_paragraph(f"{name} resume")
+        path = tmp_path / f"{name}.docx"
+        document.save(path)
+        paths.append(str(path))
+    paths = [paths[0], str(tmp_path / "missing.docx"), str(tmp_path / "missing2.docx"), paths[1]]
+    results = list(parse_many_files(paths, workers=2, chunksize=1))
+    assert [result is None for result in results] == [False, True, True, False]
@@ -0,0 +1,102 @@
+import pytest
+import spacy
+from src.core.resume_parser import ResumeParser
+
+@pytest.fixture
+def gpe_nlp():
+    """Fixture to provide a blank pipeline that tags a few place names as GPE"""
+    nlp = spacy.blank("en")
+    ruler = nlp.add_pipe("entity_ruler")
+    ruler.add_patterns([
+        {"label": "GPE", "pattern": "Austin"},
+        {"label": "GPE", "pattern": "Angeles"}
+    ])
+    return nlp
+
+def test_location_city_from_exact_name(parser, gpe_nlp, monkeypatch):
+    """Test that a GPE entity naming a known city is taken as the city"""
+    monkeypatch.setattr(parser, "nlp", gpe_nlp)
+    location = parser._extract_location("Currently based in Austin")
+    assert location['city'].value == "Austin"
+
+def test_location_city_rejects_partial_name(parser, gpe_nlp, monkeypatch):
+    """Test that a GPE entity that is only part of a city name is not taken as a city"""
+    monkeypatch.setattr(parser, "nlp", gpe_nlp)
+    location = parser._extract_location("Relocating from Angeles")
+    assert location['city'].value == ""
+
+def test_state_from_known_zip(parser):
+    """Test state lookup for a ZIP code in the cities database"""
+    assert parser._state_from_zip("10001") == "NY"
+    assert parser._state_from_zip("10001-1234") == "NY"
+
+def test_state_from_unknown_zip(parser):
+    """Test that a 5-digit number missing from the database gives no state"""
+    assert parser._state_from_zip("50000") == ""
+
+def test_location_ignores_non_zip_numbers(parser):
+    """Test that counts in resume text are not turned into a state"""
+    location = parser._extract_location("Built a platform serving 50000 users")
+    assert location['state'].value == ""
+    assert location['state'].method != "zip_database"
+
+def test_location_state_from_zip(parser):
+    """Test state resolution from a ZIP code in the text"""
+    location = parser._extract_location("Mailing code 10001")
+    assert location['state'].value == "NY"
+    assert location['state'].method == "zip_database"
+    assert location['zip'].value == "10001"
+
+def test_location_city_drops_municipality_suffix(parser, monkeypatch):
+    """Test that a trailing "City" is dropped only when the full name is unknown"""
+    nlp = spacy.blank("en")
+    nlp.add_pipe("entity_ruler").add_patterns([
+        {"label": "GPE", "pattern": "New York City"},
+        {"label": "GPE", "pattern": "Jersey City"}
+    ])
+    monkeypatch.setattr(parser, "nlp", nlp)
+    location = parser._extract_location("Moved from New York City")
+    assert location['city'].value == "New York"
+    assert location['state'].value == "NY"
+    location = parser._extract_location("Moved from Jersey City")
+    assert location['city'].value == "Jersey City"
+
+def test_location_from_address(parser):
+    """Test that a "City, ST 12345" address gives city, state and zip"""
+    location = parser._extract_location("Mailing address: Austin, TX 78701")
+    assert location['city'].value == "Austin"
+    assert location['state'].value == "TX"
+    assert location['zip'].value == "78701"
+    assert location['city'].method == "address_pattern"
+
+def test_cities_database_loaded(parser):
+    """Test that cities, ZIP codes and state names load from the CSV"""
+    assert parser.cities_by_name["new york_ny"]["state_name"] == "New York"
+    assert parser.zip_codes["10001"][0]["city"] == "new york"
+    assert parser.state_names["new york"] == "NY"
+    assert parser.state_names["ny"] == "NY"
+
+def test_cities_database_skips_rows_without_zips(parser):
+    """Test that rows with an empty zips cell are skipped rather than given a 'nan' ZIP"""
+    assert "nan" not in parser.zip_codes
+    assert "attu station_ak" not in parser.cities_by_name
+    assert "eareckson station_ak" not in parser.cities_by_name
+
+def test_cities_database_with_bom_header(tmp_path, monkeypatch):
+    """Test loading a cities CSV saved with a UTF-8 byte order mark"""
+    csv_dir = tmp_path / "data" / "cities database"
+    csv_dir.mkdir(parents=True)
+    (csv_dir / "us_cities.csv").write_text(
+        "city,state_id,state_name,zips\n"
+        "Austin,TX,Texas,73301 78701\n"
+        "Nowhere,TX,Texas,\n",
+        encoding="utf-8-sig"
+    )
+    monkeypatch.chdir(tmp_path)
+    # Only the loader is under test; skip model loading in __init__
+    loader = ResumeParser.__new__(ResumeParser)
+    loader._load_cities_database()
+    assert list(loader.cities_by_name) == ["austin_tx"]
+    assert loader.cities_by_name["austin_tx"]["zips"] == ["73301", "78701"]
+    assert loader.zip_codes["78701"][0] is loader.zip_codes["73301"][0]
+    assert loader._state_from_zip("78701-1234") == "TX"
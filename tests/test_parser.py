@@ -66,6 +66,23 @@ def test_extract_contact_info(resume_parser):
     assert resume_data.secondary_email == "test2@example.com"
     assert resume_data.phone == "(555) 999-8888"
 
+def test_extract_contact_info_secondary_email_only(parser):
+    """Test that the only email, listed under a Secondary Email label, is also the primary email"""
+    contact_info = parser._extract_contact_info(
+        "Jane Smith Secondary Email: jane.smith@example.com Phone: (555) 999-8888"
+    )
+    
+    assert contact_info["primary_email"].value == "jane.smith@example.com"
+    assert contact_info["secondary_email"].value == "jane.smith@example.com"
+    assert contact_info["phone"].value == "5559998888"
+
+def test_extract_contact_info_phone_inside_email(parser):
+    """Test that digits inside an email address are still read as a phone number"""
+    contact_info = parser._extract_contact_info("Jane Smith jsmith5559998888@example.com")
+    
+    assert contact_info["primary_email"].value == "jsmith5559998888@example.com"
+    assert contact_info["phone"].value == "5559998888"
+
 def test_extract_professional_info(resume_parser):
     """Test professional information extraction"""
     text = """
@@ -81,6 +98,16 @@ def test_extract_professional_info(resume_parser):
     assert resume_data.experience == "8"
     assert resume_data.work_authority == "H1B"
 
+def test_extract_total_experience_phrasing_priority(parser):
+    """Test that a higher-priority phrasing wins over an earlier, lower-priority one"""
+    text = "Cloud engineer, 8 yrs of exp in AWS. Seasoned professional with over 15 years in IT."
+    assert parser._extract_total_experience(text).value == "15"
+
+def test_extract_total_experience_skips_out_of_range_count(parser):
+    """Test that a phrasing whose first match has more than 50 years gives way to the next one"""
+    text = "Seasoned professional with 60 years combined. Track record of 7 years in QA."
+    assert parser._extract_total_experience(text).value == "7"
+
 def test_extract_skills(resume_parser):
     """Test skills extraction"""
     text = """